@@ -88,7 +88,7 @@ class FiringBase:
             unaligned_lines.append(
                 affinity.rotate(
                     line, -self._burn_unit.firing_alignment_angle,
-                    self._burn_unit.centroid
+                    self._burn_unit._center
                 )
             )
 
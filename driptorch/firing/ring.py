@@ -12,6 +12,9 @@ from ..personnel import IgnitionCrew
 from ..pattern import Pattern
 from ..warnings import CrewSizeWarning
 
+# External imports
+from shapely.geometry import LineString
+
 
 class Ring(FiringBase):
     """Ring firing involves two igniters walking along the boundary of the firing area from the
@@ -78,8 +81,9 @@ class Ring(FiringBase):
         starboard_line = firing_area.polygon_segments.starboard
 
         # Reverse the port line coords so that both igniters start at the fore
-        # anchor point and end at the aft anchor point
-        port_line.coords = list(port_line.coords)[::-1]
+        # anchor point and end at the aft anchor point. Build a new line rather than
+        # editing the segment in place since the buffered unit may be shared
+        port_line = LineString(list(port_line.coords)[::-1])
 
         # Both igniters get assigned to the same heat and each igniter
         # path only has a single leg
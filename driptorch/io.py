@@ -7,16 +7,39 @@ from .templates import QuicFire
 from .errors import *
 from ._version import __version__
 
+# Core imports
+from functools import lru_cache
+
 # External imports
-from folium import Polygon
 import numpy as np
 import pyproj
-from shapely.geometry import mapping, shape, MultiLineString, LineString, Point, MultiPoint
+from shapely.geometry import mapping, shape, MultiLineString, LineString, Point, MultiPoint, Polygon
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import transform
 from typing import Union
 
 
+@lru_cache(maxsize=None)
+def _get_transformer(src_epsg: int, dst_epsg: int) -> pyproj.Transformer:
+    """Build a transformer between two EPSG codes. Transformers are cached since
+    they are expensive to create and the same few CRS pairs are used throughout.
+
+    Parameters
+    ----------
+    src_epsg : int
+        Source EPSG code
+    dst_epsg : int
+        Destination EPSG code
+
+    Returns
+    -------
+    pyproj.Transformer
+        Transformer with x/y (lon/lat) axis order
+    """
+
+    return pyproj.Transformer.from_crs(f'epsg:{src_epsg}', f'epsg:{dst_epsg}', always_xy=True)
+
+
 class Projector:
     """
     Helper class to handle reprojections during I/O operations.
@@ -32,18 +55,10 @@ class Projector:
     def __init__(self, src_epsg: int, dst_epsg: int):
 
         # Configure transformer for forward projections
-        self.forward_proj = pyproj.Transformer.from_proj(
-            pyproj.Proj(f'epsg:{src_epsg}'),
-            pyproj.Proj(f'epsg:{dst_epsg}'),
-            always_xy=True
-        )
+        self.forward_proj = _get_transformer(src_epsg, dst_epsg)
 
         # Configure transform for inverse projections
-        self.backward_proj = pyproj.Transformer.from_proj(
-            pyproj.Proj(f'epsg:{dst_epsg}'),
-            pyproj.Proj(f'epsg:{src_epsg}'),
-            always_xy=True
-        )
+        self.backward_proj = _get_transformer(dst_epsg, src_epsg)
 
     def forward(self, geometry: BaseGeometry) -> BaseGeometry:
         """Project from source EPSG to destination EPSG
@@ -59,7 +74,7 @@ class Projector:
             Reprojected geometry
         """
 
-        return transform(self.forward_proj.transform, geometry)
+        return _project(self.forward_proj, geometry)
 
     def backward(self, geometry: BaseGeometry) -> BaseGeometry:
         """Project from destimation EPSG to source EPSG
@@ -75,7 +90,7 @@ class Projector:
             Reprojected geometry
         """
 
-        return transform(self.backward_proj.transform, geometry)
+        return _project(self.backward_proj, geometry)
 
     @staticmethod
     def estimate_utm_epsg(lon, lat, **kwargs):
@@ -213,9 +228,12 @@ def write_geojson(geometries: list[BaseGeometry], src_epsg: int, dst_epsg: int =
     # Get the names of all the props
     property_names = properties.keys()
 
+    # Project all of the geometries together
+    projected_geometries = _project_all(projector.forward_proj, geometries)
+
     # Loop over each geometry in the input list and write to GeoJSON
     features = []
-    for i, geometry in enumerate(geometries):
+    for i, geometry in enumerate(projected_geometries):
 
         props = {}
         for name in property_names:
@@ -225,7 +243,7 @@ def write_geojson(geometries: list[BaseGeometry], src_epsg: int, dst_epsg: int =
             {
                 'type': 'Feature',
                 'properties': props | style,
-                'geometry': mapping(projector.forward(geometry))
+                'geometry': mapping(geometry)
             }
         )
 
@@ -274,21 +292,28 @@ def write_quicfire(geometry: list, times: list, elapsed_time, resolution: int =
     # Process ignition paths for QF format 5
     if all(isinstance(x, (LineString, MultiLineString)) for x in geometry):
 
-        # Loop over each geometry
+        # Flatten the geometry into its individual lines
+        lines, line_times = [], []
         for i, geom in enumerate(geometry):
             time = times[i]
             # Check if we have a linestring and wrap in a list if so
             if isinstance(geom, LineString):
                 geom = [geom]
                 time = [time]
-            # Loop over each line in the geometry
             for j, part in enumerate(geom):
-                coords = np.array(part.coords)
-                t = time[j]
-                # Loop over each coordinate in the line
-                for k, xy in enumerate(coords[:-1]):
-                    rows += f'{xy[0]} {xy[1]} {coords[k+1,0]} {coords[k+1,1]} {t[k]} {t[k+1]}\n'
-                    n_rows += 1
+                # Only x and y are written, so drop any z values. Empty lines have no
+                # columns to slice
+                xy = np.asarray(part.coords, dtype=float)
+                lines.append(xy[:, :2] if xy.ndim == 2 else np.empty((0, 2)))
+                line_times.append(time[j])
+
+        # Pack the line coordinates into a single array and format the rows from it
+        offsets = np.zeros(len(lines) + 1, dtype=int)
+        np.cumsum([len(line) for line in lines], out=offsets[1:])
+        coords = np.concatenate(lines) if lines else np.empty((0, 2))
+        path_rows = _quicfire_path_rows(coords, offsets, line_times)
+        rows = ''.join(path_rows)
+        n_rows = len(path_rows)
         file = QuicFire.fmt_5.substitute(
             n_rows=n_rows, rows=rows, elapsed_time=round(elapsed_time, 2))
 
@@ -317,3 +342,154 @@ def write_quicfire(geometry: list, times: list, elapsed_time, resolution: int =
     file = '\n'.join([line for line in file.split('\n') if line.strip()])
 
     return file
+
+
+def _quicfire_path_rows(coords: np.ndarray, offsets: np.ndarray, times: list) -> list[str]:
+    """Format QUIC-fire format 5 rows from packed line coordinates. Each row is a
+    segment of a line with the arrival times at its start and end.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        (N, 2) array of the coordinates of every line
+    offsets : np.ndarray
+        (M + 1,) array where line ``i`` spans ``coords[offsets[i]:offsets[i + 1]]``
+    times : list
+        Arrival times for the coordinates of each line
+
+    Returns
+    -------
+    list[str]
+        Formatted rows
+    """
+
+    # Convert to Python floats in one go rather than indexing NumPy per value
+    xy = coords.tolist()
+
+    rows = []
+    for (start, end), t in zip(zip(offsets[:-1], offsets[1:]), times):
+        rows.extend(
+            f'{x0} {y0} {x1} {y1} {t0} {t1}\n'
+            for (x0, y0), (x1, y1), t0, t1
+            in zip(xy[start:end - 1], xy[start + 1:end], t, t[1:])
+        )
+
+    return rows
+
+
+def _project(transformer: pyproj.Transformer, geometry: BaseGeometry) -> BaseGeometry:
+    """Reproject a single geometry, see ``_project_all``
+
+    Parameters
+    ----------
+    transformer : pyproj.Transformer
+        Transformer to apply
+    geometry : BaseGeometry
+        Input geometry to reproject
+
+    Returns
+    -------
+    BaseGeometry
+        Reprojected geometry
+    """
+
+    return _project_all(transformer, [geometry])[0]
+
+
+def _project_all(transformer: pyproj.Transformer, geometries: list[BaseGeometry]) -> list[BaseGeometry]:
+    """Reproject a list of geometries with a single transformer call over all of their
+    coordinates, rather than handing pyproj one ring or line at a time. Geometries that
+    can't be packed (empty, 3D, collections) go through ``shapely.ops.transform``.
+
+    Parameters
+    ----------
+    transformer : pyproj.Transformer
+        Transformer to apply
+    geometries : list[BaseGeometry]
+        Input geometries to reproject
+
+    Returns
+    -------
+    list[BaseGeometry]
+        Reprojected geometries
+    """
+
+    parts = [_coordinate_parts(geometry) for geometry in geometries]
+    packed = [part for geom_parts in parts if geom_parts for part in geom_parts]
+
+    # Project every coordinate at once and split back out to the individual parts
+    if packed:
+        splits = np.cumsum([len(part) for part in packed])[:-1]
+        coords = np.concatenate(packed)
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        projected = iter(np.split(np.column_stack((x, y)), splits))
+
+    projected_geometries = []
+    for geometry, geom_parts in zip(geometries, parts):
+        if geom_parts:
+            projected_parts = [next(projected) for _ in geom_parts]
+            projected_geometries.append(_from_parts(geometry, projected_parts))
+        else:
+            projected_geometries.append(transform(transformer.transform, geometry))
+
+    return projected_geometries
+
+
+def _coordinate_parts(geometry: BaseGeometry) -> list[np.ndarray] | None:
+    """Split a geometry into (N, 2) coordinate arrays, one per ring, line or point
+
+    Parameters
+    ----------
+    geometry : BaseGeometry
+        Input geometry
+
+    Returns
+    -------
+    list[np.ndarray] | None
+        Coordinate arrays, or None if the geometry type or dimension isn't supported
+    """
+
+    if isinstance(geometry, Polygon):
+        parts = [np.array(geometry.exterior.coords)]
+        parts += [np.array(ring.coords) for ring in geometry.interiors]
+    elif isinstance(geometry, (LineString, Point)):
+        parts = [np.array(geometry.coords)]
+    elif isinstance(geometry, (MultiLineString, MultiPoint)):
+        parts = [np.array(part.coords) for part in geometry.geoms]
+    else:
+        return None
+
+    # Leave empty and 3D geometries to shapely
+    if not parts or any(part.ndim != 2 or part.shape[1] != 2 for part in parts):
+        return None
+
+    return parts
+
+
+def _from_parts(geometry: BaseGeometry, parts: list[np.ndarray]) -> BaseGeometry:
+    """Rebuild a geometry of the same type from the arrays given by ``_coordinate_parts``
+
+    Parameters
+    ----------
+    geometry : BaseGeometry
+        Geometry the parts were taken from
+    parts : list[np.ndarray]
+        Coordinate arrays
+
+    Returns
+    -------
+    BaseGeometry
+        New geometry
+    """
+
+    if isinstance(geometry, Polygon):
+        return Polygon(parts[0], parts[1:])
+    if isinstance(geometry, Point):
+        return Point(parts[0][0])
+    if isinstance(geometry, MultiLineString):
+        return MultiLineString(parts)
+    if isinstance(geometry, MultiPoint):
+        return MultiPoint([part[0] for part in parts])
+
+    # LinearRing subclasses LineString, so rebuild from the geometry's own type
+    return type(geometry)(parts[0])
@@ -38,6 +38,69 @@ as long as we don't upgrade the Shapely req to v2.
 warnings.filterwarnings("ignore", category=ShapelyDeprecationWarning)
 
 
+def _pack_coords(geometries: list) -> tuple[np.ndarray, np.ndarray] | None:
+    """Pack the coordinates of a list of LineStrings into a single array. Line ``i``
+    spans ``coords[offsets[i]:offsets[i + 1]]``.
+
+    Parameters
+    ----------
+    geometries : list
+        Geometries to pack
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray] | None
+        Packed (N, 2) coordinate array and (M + 1,) offsets array, or None if any
+        geometry is not a non-empty 2D LineString
+    """
+
+    coords = [np.array(geom.coords) for geom in geometries
+              if isinstance(geom, LineString)]
+
+    # Dashes and dots produce multipart geometries, which can't be packed. Neither
+    # can empty or 3D lines
+    if len(coords) != len(geometries) or any(c.ndim != 2 or c.shape[1] != 2 for c in coords):
+        return None
+
+    offsets = np.zeros(len(coords) + 1, dtype=int)
+    np.cumsum([len(c) for c in coords], out=offsets[1:])
+    packed = np.concatenate(coords) if coords else np.empty((0, 2))
+
+    return packed, offsets
+
+
+def _translate_geometries(geometries: list, x_off: float, y_off: float) -> list:
+    """Translate a list of geometries by a constant offset. LineString coordinates are
+    packed into one array and shifted in a single NumPy operation, other geometry types
+    fall back to ``affinity.translate``.
+
+    Parameters
+    ----------
+    geometries : list
+        Geometries to translate
+    x_off : float
+        Offset along the x axis
+    y_off : float
+        Offset along the y axis
+
+    Returns
+    -------
+    list
+        Translated geometries
+    """
+
+    packed = _pack_coords(geometries)
+    if packed is None:
+        return [affinity.translate(geom, x_off, y_off) for geom in geometries]
+
+    # Shift every coordinate at once and split back out to the individual lines
+    coords, offsets = packed
+    shifted = coords + (x_off, y_off)
+
+    return [LineString(shifted[start:end])
+            for start, end in zip(offsets[:-1], offsets[1:])]
+
+
 class Pattern:
     """Patterns are objects that store the spatial and temporal components of a
     firing technique.
@@ -93,32 +156,50 @@ class Pattern:
             A new instance of Pattern
         """
 
-        paths_dict["geometry"] = [shape(x) for x in paths_dict["geometry"]]
+        # Don't write the shapely geometries back into the caller's dictionary
+        geometry = [shape(x) for x in paths_dict["geometry"]]
         return cls(
             paths_dict["heat"],
             paths_dict["igniter"],
             paths_dict["leg"],
             paths_dict["times"],
-            paths_dict["geometry"],
+            geometry,
             epsg,
         )
 
-    def to_dict(self) -> dict:
+    def to_dict(self, packed: bool = False) -> dict:
         """Returns the Pattern path parameters as a dictionary
 
+        Parameters
+        ----------
+        packed : bool, optional
+            If true, LineString coordinates are returned as views of a single packed
+            ndarray rather than nested tuples. This skips boxing every vertex as a Python
+            float, but the result can only be serialized by a NumPy aware encoder such as
+            ``orjson`` with ``OPT_SERIALIZE_NUMPY``. Defaults to False.
+
         Returns
         -------
         dict
             Pattern path parameters
         """
 
+        packed_coords = _pack_coords(self.geometry) if packed else None
+
+        # convert to geoJSON for storage
+        if packed_coords is not None:
+            coords, offsets = packed_coords
+            geometry = [{"type": "LineString", "coordinates": coords[start:end]}
+                        for start, end in zip(offsets[:-1], offsets[1:])]
+        else:
+            geometry = [x.__geo_interface__ for x in self.geometry]
+
         return {
             "heat": self.heat,
             "igniter": self.igniter,
             "leg": self.leg,
             "times": self.times,
-            # convert to geoJSON for storage
-            "geometry": [x.__geo_interface__ for x in self.geometry],
+            "geometry": geometry,
         }
 
     @staticmethod
@@ -196,10 +277,7 @@ class Pattern:
         """
 
         # Translate the path geometries
-        geoms = self.geometry
-        trans_geoms = []
-        for geom in geoms:
-            trans_geoms.append(affinity.translate(geom, x_off, y_off))
+        trans_geoms = _translate_geometries(self.geometry, x_off, y_off)
 
         # Create a clone of the existing Pattern object and replace the geometries
         # with the translated geometries
@@ -255,11 +333,8 @@ class Pattern:
 
         # Translate pattern geometry to the origin or the CRS according to the burn unit extent
         lower_left = domain.bounds.min(axis=0)
-        trans_geoms = []
-        for geom in geometry:
-            trans_geoms.append(affinity.translate(
-                geom, -lower_left[0], -lower_left[1]))
-        geometry = trans_geoms
+        geometry = _translate_geometries(
+            geometry, -lower_left[0], -lower_left[1])
 
         # Check if filename was provided and write to it if so
         if filename:
@@ -8,6 +8,7 @@ the boundary to firing-centric segments
 # Core imports
 from __future__ import annotations
 import copy
+from math import cos, pi, sin
 
 # Internal imports
 from .io import Projector, write_geojson, read_geojson_polygon
@@ -15,7 +16,7 @@ from ._grid import Grid, Bounds, AlbersConusDEM
 
 # External imports
 import numpy as np
-from shapely.geometry import Polygon, LineString, Point
+from shapely.geometry import Polygon, LineString
 from shapely import affinity
 
 
@@ -34,6 +35,10 @@ class BurnUnit:
         that coordinates are in 4326 and will be converted to UTM. Defaults to None.
     """
 
+    __slots__ = ('dem', 'utm_epsg', 'polygon', 'firing_direction', 'centroid',
+                 '_center', 'polygon_segments', 'firing_alignment_angle',
+                 '_buffer_cache')
+
     def __init__(self,
                  polygon: Polygon,
                  firing_direction: float,
@@ -53,15 +58,28 @@ class BurnUnit:
         self.centroid = polygon.centroid
         self.polygon_segments = PolygonSplitter()
 
+        # Control line buffers keyed by width. Copies share this dict so firing
+        # techniques built from the same unit can reuse each other's buffers
+        self._buffer_cache = {}
+
+        # Keep the centroid coordinates as plain floats for use as the rotation
+        # origin so we don't go back to the Point geometry on every rotation
+        self._center = self.centroid.coords[0]
+
         # Compute the angle used to rotate the unit s.t. the firing direction
         # is congruent with the positive x-axis
         self.firing_alignment_angle = (self.firing_direction - 90) % 360
 
-        # Align the unit, run the boundary splitting algorithm for
-        # anchors and segs, and then unalign
-        self._align()
-        self.polygon_segments.split(self.polygon)
-        self._unalign()
+        # Run the boundary splitting algorithm for anchors and segs on an aligned
+        # copy of the polygon and then unalign the segs. The polygon itself is
+        # already in its original orientation, so there is no need to rotate it back
+        if self.firing_alignment_angle:
+            self.polygon_segments.split(affinity.rotate(
+                polygon, self.firing_alignment_angle, self._center))
+            self.polygon_segments.rotate(
+                -self.firing_alignment_angle, self._center)
+        else:
+            self.polygon_segments.split(polygon)
 
     @classmethod
     def from_json(cls, geojson: dict, firing_direction: float, **kwargs) -> BurnUnit:
@@ -89,7 +107,7 @@ class BurnUnit:
         return cls(polygon, firing_direction, **kwargs)
 
     def to_json(self, **kwargs) -> dict:
-        """Returns a GeoJSON representation of the ``BurnUnit`` as a string
+        """Returns a GeoJSON representation of the ``BurnUnit`` as a dictionary
 
         Parameters
         ----------
@@ -117,9 +135,9 @@ class BurnUnit:
 
         if self.firing_alignment_angle:
             self.polygon = affinity.rotate(
-                self.polygon, self.firing_alignment_angle, self.centroid)
+                self.polygon, self.firing_alignment_angle, self._center)
             self.polygon_segments.rotate(
-                self.firing_alignment_angle, self.centroid)
+                self.firing_alignment_angle, self._center)
 
     def _unalign(self):
         """Revert the unit and boundary seg to their origional orientation
@@ -127,9 +145,9 @@ class BurnUnit:
 
         if self.firing_alignment_angle:
             self.polygon = affinity.rotate(
-                self.polygon, -self.firing_alignment_angle, self.centroid)
+                self.polygon, -self.firing_alignment_angle, self._center)
             self.polygon_segments.rotate(
-                -self.firing_alignment_angle, self.centroid)
+                -self.firing_alignment_angle, self._center)
 
     def copy(self) -> BurnUnit:
         """Utility method for copying a BurnUnit instance
@@ -140,7 +158,28 @@ class BurnUnit:
             New instance of a BurnUnit
         """
 
-        return copy.copy(self)
+        return self.__copy__()
+
+    def __copy__(self) -> BurnUnit:
+        """Shallow copy that assigns each slot directly, bypassing the generic
+        ``copy`` module machinery.
+        """
+
+        # Build the copy from the instance's own class so subclasses keep their type,
+        # and carry over any slots or attributes a subclass adds
+        cls = type(self)
+        new = cls.__new__(cls)
+        for klass in cls.__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                    setattr(new, name, getattr(self, name))
+        if hasattr(self, "__dict__"):
+            new.__dict__.update(self.__dict__)
+
+        # Aligning rotates the segments in place, so each copy needs its own splitter
+        new.polygon_segments = copy.copy(self.polygon_segments)
+
+        return new
 
     def buffer_control_line(self, width: float) -> BurnUnit:
         """Shrink the burn unit to account for the width of the control line
@@ -156,10 +195,19 @@ class BurnUnit:
             New instance of a BurnUnit
         """
 
+        # Reuse a previous buffer of this polygon if there is one. Entries are tied
+        # to the polygon object so an aligned copy doesn't pick up a stale buffer
+        cached = self._buffer_cache.get(width)
+        if cached is not None and cached[0] is self.polygon:
+            return cached[1].copy()
+
         # Use shapely's buffer method on the polygon
         buffered_polygon = self.polygon.buffer(-width)
+        buffered_unit = BurnUnit(
+            buffered_polygon, self.firing_direction, utm_epsg=self.utm_epsg)
+        self._buffer_cache[width] = (self.polygon, buffered_unit)
 
-        return BurnUnit(buffered_polygon, self.firing_direction, utm_epsg=self.utm_epsg)
+        return buffered_unit.copy()
 
     def buffer_downwind(self, width: float) -> BurnUnit:
         """Create a downwind blackline buffer
@@ -185,6 +233,42 @@ class BurnUnit:
 
         return BurnUnit(buffered_polygon, self.firing_direction, utm_epsg=self.utm_epsg)
 
+    def buffer_firing_area(self, control_line_width: float, downwind_width: float) -> BurnUnit:
+        """Apply the control line buffer and the downwind blackline buffer in one pass.
+        Equivalent to calling ``buffer_control_line`` followed by ``buffer_downwind``
+        without building the intermediate BurnUnit.
+
+        Parameters
+        ----------
+        control_line_width : float
+            Width of the control line (meters)
+        downwind_width : float
+            Width of downwind buffer (meters)
+
+        Returns
+        -------
+        BurnUnit
+            New instance of a BurnUnit
+        """
+
+        # Shrink the polygon for the control line
+        buffered_polygon = self.polygon.buffer(-control_line_width)
+
+        # Split the aligned control line polygon and rotate back only the fore line,
+        # which is all we need for the downwind buffer
+        center = buffered_polygon.centroid.coords[0]
+        segments = PolygonSplitter()
+        segments.split(affinity.rotate(
+            buffered_polygon, self.firing_alignment_angle, center))
+        fore_line = affinity.rotate(
+            segments.fore, -self.firing_alignment_angle, center)
+
+        # Cut out the downfiring blackline area
+        fore_line_buffer = fore_line.buffer(downwind_width, cap_style=3)
+        buffered_polygon = buffered_polygon.difference(fore_line_buffer)
+
+        return BurnUnit(buffered_polygon, self.firing_direction, utm_epsg=self.utm_epsg)
+
     def difference(self, burn_unit: BurnUnit) -> BurnUnit:
         """Return a burn unit instance that is the difference between
         this burn unit and another. Useful for obtaining the blackline
@@ -249,7 +333,16 @@ class BurnUnit:
             Bounding box of the unit
         """
 
-        return np.array(self.polygon.envelope.exterior.coords[:-1])
+        # Build the corners straight from the bounds tuple rather than constructing
+        # the envelope geometry. Corner ordering matches the envelope's exterior ring.
+        x_min, y_min, x_max, y_max = self.polygon.bounds
+
+        return np.array([
+            [x_min, y_min],
+            [x_max, y_min],
+            [x_max, y_max],
+            [x_min, y_max]
+        ])
 
 
 class PolygonSplitter:
@@ -265,22 +358,28 @@ class PolygonSplitter:
         self.port: LineString = None
         self.starboard: LineString = None
 
-    def rotate(self, angle: float, origin: Point):
+    def rotate(self, angle: float, origin: tuple[float, float]):
         """Helper method to rotate all four boundary segs
 
         Args:
             angle (float): Angle to rotate line by (degrees)
-            origin (Point): Origin of rotation
+            origin (tuple[float, float]): Origin of rotation
         """
 
-        self.fore = affinity.rotate(
-            self.fore, angle, origin) if self.fore else self.fore
-        self.aft = affinity.rotate(
-            self.aft, angle, origin) if self.aft else self.aft
-        self.port = affinity.rotate(
-            self.port, angle, origin) if self.port else self.port
-        self.starboard = affinity.rotate(
-            self.starboard, angle, origin) if self.starboard else self.starboard
+        # Gather the segments that have been computed so far
+        names = [name for name in ('fore', 'aft', 'port', 'starboard')
+                 if getattr(self, name)]
+        if not names:
+            return
+
+        # Stack the coordinates of all segments and rotate them in one pass
+        coords = [np.array(getattr(self, name).coords) for name in names]
+        splits = np.cumsum([len(seg) for seg in coords])[:-1]
+        rotated = _rotate_coords(np.concatenate(coords), angle, origin)
+
+        # Split the rotated coordinates back out to their segments
+        for name, seg in zip(names, np.split(rotated, splits)):
+            setattr(self, name, LineString(seg))
 
     def split(self, polygon: Polygon):
         """Split the polygon to four firing-centric segments
@@ -289,7 +388,9 @@ class PolygonSplitter:
             polygon (Polygon): Polygon to split
         """
 
-        self.coords = np.array(polygon.exterior.coords[:-1])
+        # Read the ring straight into an array (slicing the coordinate sequence
+        # first would build a list of tuples) and drop the closing vertex
+        self.coords = np.array(polygon.exterior.coords)[:-1]
 
         # Extract fore, aft, port and starboard anchor points
         fore_idx = self._get_anchor(0)
@@ -342,18 +443,46 @@ class PolygonSplitter:
 
         # Condtionally extract minimum and maximum anchor point in the linear
         # ring for the specified dimension
+        values = self.coords[:, dimension]
         if side == 'lower':
-            idx = np.where(self.coords[:, dimension] ==
-                           self.coords[:, dimension].min())[0]
+            candidates = values == values.min()
         else:
-            idx = np.where(self.coords[:, dimension] ==
-                           self.coords[:, dimension].max())[0]
+            candidates = values == values.max()
 
-        # If more than one anchor, select the most upfiring anchor
-        if len(idx) > 1:
-            idx = idx[np.argmax(self.coords[idx, 0])]
-        else:
-            idx = idx[0]
+        # Mask out non-candidates so a single argmax selects the most upfiring
+        # anchor. Ties on x resolve to the first index, same as before.
+        upfiring = np.where(candidates, self.coords[:, 0], -np.inf)
+
+        return int(np.argmax(upfiring))
+
+
+def _rotate_coords(coords: np.ndarray, angle: float, origin: tuple[float, float]) -> np.ndarray:
+    """Rotate a coordinate array counter-clockwise about an origin. Mirrors
+    ``shapely.affinity.rotate`` for 2D coordinates, including its snapping of
+    near-zero trig terms, so results are identical.
+
+    Args:
+        coords (np.ndarray): Coordinate array of shape (n, 2)
+        angle (float): Angle of rotation (degrees)
+        origin (tuple[float, float]): Origin of rotation
+
+    Returns:
+        np.ndarray: Rotated coordinate array
+    """
+
+    angle = angle * pi / 180.0
+    cosp = cos(angle)
+    sinp = sin(angle)
+    if abs(cosp) < 2.5e-16:
+        cosp = 0.0
+    if abs(sinp) < 2.5e-16:
+        sinp = 0.0
+
+    x0, y0 = origin
+    xoff = x0 - x0 * cosp + y0 * sinp
+    yoff = y0 - x0 * sinp - y0 * cosp
+
+    x, y = coords[:, 0], coords[:, 1]
 
-        # Convert to shapely Point geometry and return
-        return idx
+    return np.column_stack((cosp * x - sinp * y + xoff,
+                            sinp * x + cosp * y + yoff))
@@ -0,0 +1,115 @@
+
+# Core Imports
+from functools import lru_cache
+import sys
+from typing import Callable
+
+# Internal Imports
+sys.path.append("../driptorch")
+import driptorch as dt
+from driptorch.io import Projector, read_geojson_polygon
+from resources import simulations, testgeoms
+
+# External Imports
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+"""
+Shared fixtures for the DripTorch tests.
+
+Validation data is parsed once per test session and shared between tests, so
+tests must not modify it. Copy the shared BurnUnit before mutating it.
+
+The tests can be spread across processes with pytest-xdist ("pytest -n auto").
+Each worker builds its own session fixtures.
+"""
+
+UTM_EPSG = 32612
+
+
+@pytest.fixture(scope="session")
+def validation_data() -> dict:
+    """Validation data generated by pipelines.py"""
+
+    return simulations.load_validation_data()
+
+
+@pytest.fixture(scope="session")
+def validation_times(validation_data: dict) -> dict[str, np.ndarray]:
+    """Validation pattern times as contiguous float64 arrays, keyed by pattern. Ring
+    igniters have paths of different lengths, so only the first igniter's times
+    are kept for the ring pattern"""
+
+    times = {key: value["times"] for key, value in validation_data.items()
+             if key.endswith("_pattern")}
+    times["ring_pattern"] = times["ring_pattern"][0]
+
+    return {key: np.ascontiguousarray(value, dtype=np.float64) for key, value in times.items()}
+
+
+@pytest.fixture(scope="session")
+def base_burn_unit(validation_data: dict) -> dt.BurnUnit:
+    """BurnUnit built from the validation burn unit and firing direction"""
+
+    return dt.unit.BurnUnit.from_json(
+        validation_data["burn_unit"],
+        firing_direction=validation_data["args"]["firing_direction"],
+    )
+
+
+@pytest.fixture(scope="session")
+def firing_area_factory(validation_data: dict) -> Callable[[float], dt.BurnUnit]:
+    """Builds BurnUnits of the validation firing area for a given firing direction.
+    The polygon is parsed once and each firing direction is only built once."""
+
+    polygon = read_geojson_polygon(validation_data["firing_area"])
+
+    @lru_cache(maxsize=None)
+    def factory(firing_direction: float) -> dt.BurnUnit:
+        return dt.BurnUnit(polygon, firing_direction)
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def firing_area(validation_data: dict, firing_area_factory) -> dt.BurnUnit:
+    """BurnUnit built from the validation firing area, the input to the firing techniques"""
+
+    return firing_area_factory(validation_data["args"]["firing_direction"])
+
+
+@pytest.fixture(scope="session")
+def igniter(validation_data: dict) -> dt.Igniter:
+    """Igniter moving at the validation igniter speed"""
+
+    return dt.Igniter(velocity=validation_data["args"]["igniter_speed"])
+
+
+@pytest.fixture(scope="session")
+def ignition_crew(validation_data: dict, igniter: dt.Igniter) -> dt.IgnitionCrew:
+    """Crew of validation size cloned from the igniter. Don't add igniters to it"""
+
+    return dt.IgnitionCrew.clone_igniter(igniter, validation_data["args"]["number_igniters"])
+
+
+@pytest.fixture(scope="session")
+def lower_left(validation_data: dict) -> np.ndarray:
+    """Lower left corner of the validation firing area, the QUIC-fire domain origin"""
+
+    return np.asarray(validation_data["lower_left"])
+
+
+@pytest.fixture(scope="session")
+def test_polygon_4326() -> Polygon:
+    """Shapely polygon of the test geometry in WGS84"""
+
+    return read_geojson_polygon(testgeoms.test_polygon)
+
+
+@pytest.fixture(scope="session")
+def utm_projector() -> Projector:
+    """Projector from WGS84 to UTM 12N, the zone of the reference location in
+    test_projector"""
+
+    return Projector(src_epsg=4326, dst_epsg=UTM_EPSG)
@@ -1,14 +1,16 @@
 # External Imports
-import json
+from conftest import UTM_EPSG
 from resources import testgeoms
+from resources.simulations import resource_path
 from driptorch.io import *
 import driptorch as dt
-from shapely import affinity
 from shapely.geometry.polygon import Polygon
 import numpy as np
-from numpy.testing import assert_array_almost_equal
-import os.path as path
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 import sys
+from io import StringIO
+from itertools import islice
+from typing import Iterable
 
 # Internal Imports
 sys.path.append("../driptorch")
@@ -27,30 +29,37 @@ class objects and their associated methods.
 To run these tests, call "pytest -ss -v" from the terminal.
 """
 
-SIMULATION_PATH = "resources/simulation_0.json"
-QF_VALIDATION_DATA = "resources/quicfire_output_test_ring.dat"
+QF_VALIDATION_DATA = "quicfire_output_test_ring.dat"
+QF_HEAD_LINES = 64
+QF_HEAD_TOKENS = 20
 
+# Exterior ring of the test polygon as an (N, 2) array
+TEST_POLYGON_COORDS = np.asarray(
+    testgeoms.test_polygon["features"][0]["geometry"]["coordinates"][0]
+)
 
-def test_geojson_io() -> None:
+
+def _quicfire_head(lines: Iterable[str]) -> list[str]:
+    """Return the first few tokens following the '/' delimiter of a QUIC-fire
+    ignition file. Only the first QF_HEAD_LINES lines are read."""
+
+    head = "".join(islice(lines, QF_HEAD_LINES))
+    return head.split("/")[1].strip("\n").split(" ")[:QF_HEAD_TOKENS]
+
+
+def test_geojson_io(test_polygon_4326: Polygon) -> None:
     """Test geoJSON io functionality"""
 
-    test_polygon_4326: Polygon = read_geojson_polygon(testgeoms.test_polygon)
-    polygon_points = np.array(
-        testgeoms.test_polygon["features"][0]["geometry"]["coordinates"][0]
-    )
-    test_bounds = (
-        np.min(polygon_points[:, 0]),
-        np.min(polygon_points[:, 1]),
-        np.max(polygon_points[:, 0]),
-        np.max(polygon_points[:, 1]),
-    )
+    min_xy = TEST_POLYGON_COORDS.min(axis=0)
+    max_xy = TEST_POLYGON_COORDS.max(axis=0)
+    test_bounds = (min_xy[0], min_xy[1], max_xy[0], max_xy[1])
 
-    assert test_polygon_4326.bounds == test_bounds
+    assert_array_equal(test_polygon_4326.bounds, test_bounds)
     geojson_from_Polygon = write_geojson([test_polygon_4326], 4326)
 
     # Test recreated geoJSON for order
     test_a = geojson_from_Polygon["features"][0]["geometry"]["coordinates"][0]
-    test_b = testgeoms.test_polygon["features"][0]["geometry"]["coordinates"][0]
+    test_b = TEST_POLYGON_COORDS
 
     assert_array_almost_equal(
         test_a,
@@ -60,23 +69,18 @@ def test_geojson_io() -> None:
     )
 
 
-def test_projector() -> None:
+def test_projector(test_polygon_4326: Polygon, utm_projector: Projector) -> None:
     """Test the functionality of the Projector.forward(),Projector.backward(), and Projector.estimate_utm_epsg()"""
 
     location = {"lat": 46.86028, "lon": -113.98278}
-    location_UTM_epsg = 32612
-    src_epsg = 4326
     dst_epsg: float = Projector.estimate_utm_epsg(
         **location
     )  # Estimate UTM EPSG code from lat and lon position
 
-    # Test Projector.estimate_utm_epsg
-    assert dst_epsg == location_UTM_epsg
+    # Test Projector.estimate_utm_epsg. The projector fixture uses the same zone
+    assert dst_epsg == UTM_EPSG
 
-    projecter = Projector(src_epsg=src_epsg, dst_epsg=dst_epsg)
-    test_polygon_4326: Polygon = read_geojson_polygon(
-        testgeoms.test_polygon
-    )  # Creat Polygon object from geoJSON
+    projecter = utm_projector
     test_polygon_4326_to_UTM: Polygon = projecter.forward(
         test_polygon_4326
     )  # Project from lat/lon to UTM
@@ -99,10 +103,9 @@ def test_projector() -> None:
     )
 
 
-def test_wgs84_funcs() -> None:
+def test_wgs84_funcs(test_polygon_4326: Polygon) -> None:
     """Test WGS84 functionality"""
 
-    test_polygon_4326: Polygon = read_geojson_polygon(testgeoms.test_polygon)
     utm_epsg, test_polygon_4326_to_UTM = Projector.wgs84_to_utm(
         test_polygon_4326
     )
@@ -124,47 +127,25 @@ def test_wgs84_funcs() -> None:
     )
 
 
-def test_write_quickfire() -> None:
+def test_write_quickfire(validation_data: dict, lower_left: np.ndarray) -> None:
     """Test io.write_quicfire()"""
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
     pattern = dt.pattern.Pattern.from_dict(
         validation_data["ring_pattern"], epsg=validation_data["epsg"]
     )
-    lower_left = validation_data["lower_left"]
     times = pattern.times
-    geometries = pattern.geometry
     elapsed_time = pattern.elapsed_time
 
     # Translate geometries from the firing technique t
-    trans_geoms = []
-    for geom in geometries:
-        trans_geoms.append(affinity.translate(
-            geom, -lower_left[0], -lower_left[1]))
-    geometries = trans_geoms
+    geometries = pattern.translate(-lower_left[0], -lower_left[1]).geometry
 
     # Generate quicfire output
     quicfire_output = write_quicfire(
         geometry=geometries, times=times, elapsed_time=elapsed_time
     )
-    test_quicfire_path = path.join(path.dirname(__file__), QF_VALIDATION_DATA)
+    test_quicfire_path = resource_path(QF_VALIDATION_DATA)
 
     with open(test_quicfire_path, "r") as test_quicfire_output:
-        # Truncate for speed
-        test_a = (
-            "\n".join(test_quicfire_output.readlines())
-            .replace("\n\n", "\n")
-            .split("/")[1]
-            .strip("\n")
-            .split(" ")[:20]
-        )
-        test_b = (
-            quicfire_output.replace("\n\n", "\n")
-            .split("/")[1]
-            .strip("\n")
-            .split(" ")[:20]
-        )
+        test_a = _quicfire_head(test_quicfire_output)
+    test_b = _quicfire_head(StringIO(quicfire_output))
     assert test_a == test_b
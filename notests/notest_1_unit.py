@@ -1,10 +1,10 @@
 # External Imports
 from shapely.geometry import shape
-from numpy.testing import assert_array_almost_equal
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+import pytest
 
 # Core Imports
-import json
-import os.path as path
 import sys
 
 # Internal Imports
@@ -23,45 +23,38 @@ class objects and their associated methods.
 To run these tests, call "pytest -ss -v" from the terminal.
 """
 
-SIMULATION_PATH = "resources/simulation_0.json"
 
-
-def test_json_from_to() -> None:
+def test_json_from_to(validation_data: dict, base_burn_unit: dt.BurnUnit) -> None:
     """Test BurnUnit JSON writing/reading functionality"""
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
     # Generate test data
-    burn_unit = dt.unit.BurnUnit.from_json(
-        validation_data["burn_unit"],
-        firing_direction=validation_data["args"]["firing_direction"],
-    )
+    burn_unit = base_burn_unit
     new_json = burn_unit.to_json()
 
-    test_a = burn_unit.polygon.bounds
-    test_b = dt.unit.BurnUnit.from_json(
+    new_burn_unit = dt.unit.BurnUnit.from_json(
         new_json, firing_direction=validation_data["args"]["firing_direction"]
-    ).polygon.bounds
-    assert test_a == test_b
-
-    test_a = burn_unit.polygon_segments
-    test_b = burn_unit.polygon_segments
-    assert test_a == test_b
-
+    )
 
-def test_align_unalign() -> None:
+    test_a = burn_unit.polygon.bounds
+    test_b = new_burn_unit.polygon.bounds
+    assert_array_equal(test_a, test_b)
+
+    # The boundary segments should survive the round trip too
+    for segment in ("fore", "aft", "port", "starboard"):
+        test_a = np.asarray(getattr(burn_unit.polygon_segments, segment).coords)
+        test_b = np.asarray(getattr(new_burn_unit.polygon_segments, segment).coords)
+        assert_array_almost_equal(
+            test_a,
+            test_b,
+            decimal=5,
+            err_msg=f"\nTest {segment} and round trip {segment} are not aligned\n",
+        )
+
+
+def test_align_unalign(base_burn_unit: dt.BurnUnit) -> None:
     """Test BurnUnit align functionality"""
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    burn_unit = dt.unit.BurnUnit.from_json(
-        validation_data["burn_unit"],
-        firing_direction=validation_data["args"]["firing_direction"],
-    )
+    burn_unit = base_burn_unit
 
     # Align the burn unit, then unalign and compare to the original
     aligned = burn_unit.copy()
@@ -69,8 +62,8 @@ def test_align_unalign() -> None:
     unaligned = aligned.copy()
     unaligned._unalign()
 
-    test_a = list(burn_unit.polygon.exterior.coords)
-    test_b = list(unaligned.polygon.exterior.coords)
+    test_a = np.asarray(burn_unit.polygon.exterior.coords)
+    test_b = np.asarray(unaligned.polygon.exterior.coords)
     assert_array_almost_equal(
         test_a,
         test_b,
@@ -79,19 +72,12 @@ def test_align_unalign() -> None:
     )
 
 
-def test_buffer_functions() -> None:
+def test_buffer_functions(validation_data: dict, base_burn_unit: dt.BurnUnit) -> None:
     """Test BurnUnit buffer functionality"""
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
     # Generate test data
     args = validation_data["args"]
-    burn_unit = dt.unit.BurnUnit.from_json(
-        validation_data["burn_unit"],
-        firing_direction=validation_data["args"]["firing_direction"],
-    )
+    burn_unit = base_burn_unit
     firing_area = burn_unit.buffer_control_line(args["front_buffer"])
     firing_area = firing_area.buffer_downwind(args["back_buffer"])
     blackline_area = burn_unit.difference(firing_area)
@@ -105,8 +91,8 @@ def test_buffer_functions() -> None:
     )
 
     # Build new firing area and test against the validation data
-    test_a = list(firing_area.polygon.exterior.coords)
-    test_b = list(validation_firing_area.polygon.exterior.coords)
+    test_a = np.asarray(firing_area.polygon.exterior.coords)
+    test_b = np.asarray(validation_firing_area.polygon.exterior.coords)
     assert_array_almost_equal(
         test_a,
         test_b,
@@ -115,8 +101,8 @@ def test_buffer_functions() -> None:
     )
 
     # Build new blackline area and test agains the validation data
-    test_a = list(blackline_area.polygon.exterior.coords)
-    test_b = list(validation_blackline_area.polygon.exterior.coords)
+    test_a = np.asarray(blackline_area.polygon.exterior.coords)
+    test_b = np.asarray(validation_blackline_area.polygon.exterior.coords)
     assert_array_almost_equal(
         test_a,
         test_b,
@@ -125,63 +111,48 @@ def test_buffer_functions() -> None:
     )
 
 
-def test_polygon_splitter() -> None:
-    """Test PolygonSplitter() functionality"""
+def test_buffer_firing_area(validation_data: dict, base_burn_unit: dt.BurnUnit) -> None:
+    """Test the fused BurnUnit.buffer_firing_area() against sequential buffering"""
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    # Generate validation and test data
-    burn_unit_validation = dt.unit.BurnUnit.from_json(
-        validation_data["burn_unit"],
-        firing_direction=validation_data["args"]["firing_direction"],
-    )
-    fore_validation = shape(validation_data["burn_unit_fore"])
-    aft_validation = shape(validation_data["burn_unit_aft"])
-    port_validation = shape(validation_data["burn_unit_port"])
-    starboard_validation = shape(validation_data["burn_unit_starboard"])
-    polygon_splitter_test = dt.unit.PolygonSplitter()
-    polygon_splitter_test.split(burn_unit_validation.polygon)
-
-    # Test PolygonSplitter.split() functionality
-
-    # Check Fore
-    test_a = list(polygon_splitter_test.fore.coords)
-    test_b = list(fore_validation.coords)
+    # Generate test data
+    args = validation_data["args"]
+    burn_unit = base_burn_unit
+    sequential = burn_unit.buffer_control_line(args["front_buffer"])
+    sequential = sequential.buffer_downwind(args["back_buffer"])
+    fused = burn_unit.buffer_firing_area(
+        args["front_buffer"], args["back_buffer"])
+
+    test_a = np.asarray(fused.polygon.exterior.coords)
+    test_b = np.asarray(sequential.polygon.exterior.coords)
     assert_array_almost_equal(
         test_a,
         test_b,
         decimal=5,
-        err_msg="\nTest fore and validation fore are not aligned\n",
+        err_msg="\nFused firing_area and sequential firing_area are not aligned\n",
     )
 
-    # Check Aft
-    test_a = list(polygon_splitter_test.aft.coords)
-    test_b = list(aft_validation.coords)
-    assert_array_almost_equal(
-        test_a,
-        test_b,
-        decimal=5,
-        err_msg="\nTest aft and validation aft are not aligned\n",
-    )
 
-    # Check Port
-    test_a = list(polygon_splitter_test.port.coords)
-    test_b = list(port_validation.coords)
-    assert_array_almost_equal(
-        test_a,
-        test_b,
-        decimal=5,
-        err_msg="\nTest port and validation port are not aligned\n",
-    )
+@pytest.fixture(scope="module")
+def polygon_splitter_test(base_burn_unit: dt.BurnUnit) -> dt.unit.PolygonSplitter:
+    """PolygonSplitter run on the validation burn unit, shared by the segment checks"""
+
+    polygon_splitter = dt.unit.PolygonSplitter()
+    polygon_splitter.split(base_burn_unit.polygon)
+
+    return polygon_splitter
+
+
+@pytest.mark.parametrize("segment", ["fore", "aft", "port", "starboard"])
+def test_polygon_splitter(
+    validation_data: dict, polygon_splitter_test: dt.unit.PolygonSplitter, segment: str
+) -> None:
+    """Test PolygonSplitter.split() functionality for each boundary segment"""
 
-    # Check Starboard
-    test_a = list(polygon_splitter_test.starboard.coords)
-    test_b = list(starboard_validation.coords)
+    test_a = np.asarray(getattr(polygon_splitter_test, segment).coords)
+    test_b = np.asarray(shape(validation_data[f"burn_unit_{segment}"]).coords)
     assert_array_almost_equal(
         test_a,
         test_b,
         decimal=5,
-        err_msg="\nTest starboard and validation starboard are not aligned\n",
+        err_msg=f"\nTest {segment} and validation {segment} are not aligned\n",
     )
@@ -2,9 +2,7 @@
 from numpy.testing import assert_array_almost_equal
 
 # Core Imports
-import json
 import os
-import os.path as path
 import itertools
 import tempfile
 import sys
@@ -12,6 +10,7 @@ import sys
 # Internal Imports
 sys.path.append("../driptorch")
 import driptorch as dt
+from resources.simulations import resource_path
 
 """
 The following defined functions are for testing class objects of pattern.py.
@@ -25,20 +24,14 @@ class objects and their associated methods.
 To run these tests, call "pytest -ss -v" from the terminal.
 """
 
-SIMULATION_PATH = "resources/simulation_0.json"
-QF_VALIDATION_DATA = "resources/quicfire_output_test_ring.dat"
+QF_VALIDATION_DATA = "quicfire_output_test_ring.dat"
 
 
-def test_pattern_io() -> None:
+def test_pattern_io(validation_data: dict) -> None:
     """Test the I/O functionality for Pattern
     """
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    qf_validation_data_path = path.join(
-        path.dirname(__file__), QF_VALIDATION_DATA)
-
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
+    qf_validation_data_path = resource_path(QF_VALIDATION_DATA)
 
     with open(qf_validation_data_path, "r") as file:
         qf_validation_data = "\n".join(file.readlines())
@@ -70,20 +63,10 @@ def test_pattern_io() -> None:
     assert test_a == test_b
 
 
-def test_merge() -> None:
+def test_merge(validation_data: dict) -> None:
     """Test the merging functionality for Pattern.merge()
     """
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    qf_validation_data_path = path.join(
-        path.dirname(__file__), QF_VALIDATION_DATA)
-
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    with open(qf_validation_data_path, "r") as file:
-        qf_validation_data = "\n".join(file.readlines())
-
     test_pattern_0 = dt.pattern.Pattern.from_dict(
         validation_data["head_pattern"], epsg=validation_data["epsg"]
     )
@@ -112,20 +95,10 @@ def test_merge() -> None:
     )
 
 
-def test_translate() -> None:
+def test_translate(validation_data: dict) -> None:
     """Test the translation functionality for Pattern.translate()
     """
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    qf_validation_data_path = path.join(
-        path.dirname(__file__), QF_VALIDATION_DATA)
-
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    with open(qf_validation_data_path, "r") as file:
-        qf_validation_data = "\n".join(file.readlines())
-
     test_pattern_0 = dt.pattern.Pattern.from_dict(
         validation_data["head_pattern"], epsg=validation_data["epsg"]
     )
@@ -158,20 +131,10 @@ def test_translate() -> None:
     )
 
 
-def test_temporal_propgation() -> None:
+def test_temporal_propgation(validation_data: dict) -> None:
     """Test the functionality of TemporalPropogator()
     """
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    qf_validation_data_path = path.join(
-        path.dirname(__file__), QF_VALIDATION_DATA)
-
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    with open(qf_validation_data_path, "r") as file:
-        qf_validation_data = "\n".join(file.readlines())
-
     dash_igniter = dt.Igniter(
         validation_data["args"]["igniter_speed"],
     )
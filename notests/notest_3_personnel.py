@@ -1,7 +1,5 @@
 
 # Core Imports
-import json
-import os.path as path
 import sys
 
 # Internal Imports
@@ -21,16 +19,11 @@ class objects and their associated methods.
 To run these tests, call "pytest -ss -v" from the terminal.
 """
 
-SIMULATION_PATH = "resources/simulation_0.json"
 
-def test_igniter() -> None:
+def test_igniter(validation_data: dict) -> None:
     """Test personnel.Igniter() and personnel.IgnitionCrew() functionality
     """
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
     igniter_test = dt.Igniter(
         validation_data["args"]["igniter_speed"])
     ignition_crew_test = dt.IgnitionCrew.clone_igniter(
@@ -44,10 +37,29 @@ def test_igniter() -> None:
     test_b = igniter_validation.__dict__
     assert test_a == test_b
     
-    test_a = ignition_crew_test.to_json()
-    test_b = ignition_crew_validation.to_json()
+    # Compare the crews igniter by igniter so a failure shows which fields differ
+    test_a = [igniter.__dict__ for igniter in ignition_crew_test]
+    test_b = [igniter.__dict__ for igniter in ignition_crew_validation]
     assert test_a == test_b
 
-    test_a = ignition_crew_test.add_igniter(igniter_test)
-    test_b = ignition_crew_validation.add_igniter(igniter_test)
+
+def test_add_igniter(validation_data: dict) -> None:
+    """Test personnel.IgnitionCrew.add_igniter() functionality
+    """
+
+    number_igniters = validation_data["args"]["number_igniters"]
+    igniter_test = dt.Igniter(
+        validation_data["args"]["igniter_speed"])
+    ignition_crew_test = dt.IgnitionCrew.clone_igniter(
+        igniter_test, number_igniters)
+    ignition_crew_test.add_igniter(igniter_test)
+
+    # Adding a clone should give the same crew as cloning one more igniter
+    ignition_crew_validation = dt.IgnitionCrew.clone_igniter(
+        igniter_test, number_igniters + 1)
+
+    assert len(ignition_crew_test) == number_igniters + 1
+
+    test_a = ignition_crew_test.to_json()
+    test_b = ignition_crew_validation.to_json()
     assert test_a == test_b
@@ -1,6 +1,4 @@
 # Core Imports
-import json
-import os.path as path
 import sys
 
 # Internal Imports
@@ -8,7 +6,8 @@ sys.path.append("../driptorch")
 import driptorch as dt
 
 # External Imports
-from numpy.testing import assert_array_almost_equal
+import numpy as np
+import pytest
 
 
 """
@@ -23,215 +22,74 @@ class objects and their associated methods.
 To run these tests, call "pytest -ss -v" from the terminal.
 """
 
-SIMULATION_PATH = "resources/simulation_0.json"
-
-def test_back_technique() -> None:
-    """Test back firing technique
-    """
-
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    sim_args = validation_data["args"]
-    igniter = dt.Igniter(
-       velocity = sim_args["igniter_speed"])
-
-    ignition_crew = dt.IgnitionCrew.clone_igniter(
-        igniter, sim_args["number_igniters"])
-
-    burn_unit = dt.unit.BurnUnit.from_json(
-        validation_data["firing_area"],
-        firing_direction=sim_args["firing_direction"]
-    )
-
-    technique = dt.firing.Back(burn_unit, ignition_crew)
-    test_pattern = technique.generate_pattern(sim_args["offset"])
-
-    validation_pattern = validation_data["back_pattern"]
-
-    test_a = test_pattern.times
-    test_b = validation_pattern["times"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-    test_a = [x for x in test_pattern.geometry[0].coords]
-    test_b = validation_pattern["geometry"][0]["coordinates"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-
-def test_head_technique() -> None:
-    """Test head firing technique
-    """
-
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    sim_args = validation_data["args"]
-    igniter = dt.Igniter(
-       velocity = sim_args["igniter_speed"])
-
-    ignition_crew = dt.IgnitionCrew.clone_igniter(
-        igniter, sim_args["number_igniters"])
-
-    burn_unit = dt.unit.BurnUnit.from_json(
-        validation_data["firing_area"],
-        firing_direction=sim_args["firing_direction"]
-    )
-
-    technique = dt.firing.Head(burn_unit, ignition_crew)
-    test_pattern = technique.generate_pattern(sim_args["offset"])
-
-    validation_pattern = validation_data["head_pattern"]
-
-    test_a = test_pattern.times
-    test_b = validation_pattern["times"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-    test_a = [x for x in test_pattern.geometry[0].coords]
-    test_b = validation_pattern["geometry"][0]["coordinates"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-
-def test_flank_technique() -> None:
-    """Test flank firing technique
+# Same tolerance as assert_array_almost_equal(decimal=5)
+ATOL = 1.5e-5
+
+# (technique, validation key, takes a crew, generate_pattern kwargs from the simulation args)
+TECHNIQUE_CASES = [
+    ("Back", "back_pattern", True, lambda args: {"offset": args["offset"]}),
+    ("Head", "head_pattern", True, lambda args: {"offset": args["offset"]}),
+    ("Flank", "flank_pattern", True,
+     lambda args: {"depth": args["igniter_depth"], "heat_depth": args["heat_depth"]}),
+    ("Strip", "strip_pattern", True,
+     lambda args: {"spacing": args["igniter_spacing"], "depth": args["igniter_depth"],
+                   "heat_depth": args["heat_depth"]}),
+    ("Inferno", "inferno_pattern", False, lambda args: {}),
+    ("Ring", "ring_pattern", True, lambda args: {"offset": args["offset"]}),
+]
+
+
+def _assert_close(test_a, test_b, atol: float = ATOL) -> None:
+    """Fail on the first element of test_a further than atol from test_b. Only the
+    first mismatch is reported, which keeps failures cheap on long patterns."""
+
+    test_a = np.ascontiguousarray(test_a, dtype=np.float64)
+    test_b = np.ascontiguousarray(test_b, dtype=np.float64)
+    if test_a.shape != test_b.shape:
+        pytest.fail(f"shape mismatch {test_a.shape} vs {test_b.shape}")
+
+    # Written as "not within" so that NaNs count as mismatches. flatnonzero is
+    # empty for matching and empty arrays alike
+    mismatched = np.flatnonzero(~(np.abs(test_a - test_b) <= atol))
+    if mismatched.size:
+        idx = mismatched[0]
+        pytest.fail(
+            f"first mismatch at {np.unravel_index(idx, test_a.shape)}: "
+            f"{test_a.flat[idx]} vs {test_b.flat[idx]}"
+        )
+
+
+@pytest.mark.parametrize(
+    "technique_name, validation_key, uses_crew, pattern_kwargs",
+    TECHNIQUE_CASES,
+    ids=[case[0].lower() for case in TECHNIQUE_CASES],
+)
+def test_technique(
+    validation_data: dict, validation_times: dict, firing_area: dt.BurnUnit,
+    ignition_crew: dt.IgnitionCrew, technique_name: str, validation_key: str,
+    uses_crew: bool, pattern_kwargs
+) -> None:
+    """Test each firing technique against its validation pattern
     """
 
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
     sim_args = validation_data["args"]
-    igniter = dt.Igniter(
-       velocity = sim_args["igniter_speed"])
 
-    ignition_crew = dt.IgnitionCrew.clone_igniter(
-        igniter, sim_args["number_igniters"])
+    technique_class = getattr(dt.firing, technique_name)
+    crew_args = (ignition_crew,) if uses_crew else ()
+    technique = technique_class(firing_area, *crew_args)
+    test_pattern = technique.generate_pattern(**pattern_kwargs(sim_args))
 
-    burn_unit = dt.unit.BurnUnit.from_json(
-        validation_data["firing_area"],
-        firing_direction=sim_args["firing_direction"]
-    )
-
-    technique = dt.firing.Flank(burn_unit, ignition_crew)
-    test_pattern = technique.generate_pattern(depth=sim_args["igniter_depth"],heat_depth=sim_args["heat_depth"])
-
-    validation_pattern = validation_data["flank_pattern"]
+    validation_pattern = validation_data[validation_key]
 
+    # Ring igniters have times of differing lengths, so only check the first one
     test_a = test_pattern.times
-    test_b = validation_pattern["times"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-    test_a = [x for x in test_pattern.geometry[0].coords]
-    test_b = validation_pattern["geometry"][0]["coordinates"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-
-def test_strip_technique() -> None:
-    """Test strip firing technique
-    """
-
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    sim_args = validation_data["args"]
-    igniter = dt.Igniter(
-       velocity = sim_args["igniter_speed"])
-
-    ignition_crew = dt.IgnitionCrew.clone_igniter(
-        igniter, sim_args["number_igniters"])
-
-    burn_unit = dt.unit.BurnUnit.from_json(
-        validation_data["firing_area"],
-        firing_direction=sim_args["firing_direction"]
-    )
-
-    technique = dt.firing.Strip(burn_unit, ignition_crew)
- 
-    test_pattern = technique.generate_pattern(spacing=sim_args["igniter_spacing"], depth=sim_args["igniter_depth"], heat_depth=sim_args["heat_depth"])
-
-    validation_pattern = validation_data["strip_pattern"]
-
-    test_a = test_pattern.times
-    test_b = validation_pattern["times"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-    test_a = [x for x in test_pattern.geometry[0].coords]
-    test_b = validation_pattern["geometry"][0]["coordinates"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-
-def test_inferno_technique() -> None:
-    """Test inferno firing technique
-    """
-
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    sim_args = validation_data["args"]
-
-    burn_unit = dt.unit.BurnUnit.from_json(
-        validation_data["firing_area"],
-        firing_direction=sim_args["firing_direction"]
-    )
-
-    technique = dt.firing.Inferno(burn_unit)
-    test_pattern = technique.generate_pattern()
-
-    validation_pattern = validation_data["inferno_pattern"]
-
-    test_a = test_pattern.times
-    test_b = validation_pattern["times"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-    test_a = [x for x in test_pattern.geometry[0].coords]
-    test_b = validation_pattern["geometry"][0]["coordinates"]
-
-    assert_array_almost_equal(test_a, test_b,decimal=5)
-
-
-def test_ring_technique() -> None:
-    """Test ring firing technique
-    """
-
-    validation_data_path = path.join(path.dirname(__file__), SIMULATION_PATH)
-    with open(validation_data_path, "r") as file:
-        validation_data = json.load(file)
-
-    sim_args = validation_data["args"]
-    igniter = dt.Igniter(
-       velocity = sim_args["igniter_speed"])
-
-    ignition_crew = dt.IgnitionCrew.clone_igniter(
-        igniter, sim_args["number_igniters"])
-
-    burn_unit = dt.unit.BurnUnit.from_json(
-        validation_data["firing_area"],
-        firing_direction=sim_args["firing_direction"]
-    )
-
-    technique = dt.firing.Ring(burn_unit, ignition_crew)
-    test_pattern = technique.generate_pattern(sim_args["offset"])
-
-    validation_pattern = validation_data["ring_pattern"]
-
-    test_a = test_pattern.times[0]
-    test_b = validation_pattern["times"][0]
+    test_b = validation_times[validation_key]
+    if technique_name == "Ring":
+        test_a = test_a[0]
 
-    assert_array_almost_equal(test_a, test_b,decimal=5)
+    _assert_close(test_a, test_b)
 
     test_a = [x for x in test_pattern.geometry[0].coords]
     test_b = validation_pattern["geometry"][0]["coordinates"]
 
-    assert_array_almost_equal(test_a, test_b,decimal=5)
+    _assert_close(test_a, test_b)
@@ -1,9 +1,14 @@
 
 # Core Imports
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import json
+import hashlib
+import os
 import os.path as path
+import shutil
 import sys
+from typing import Any, Iterable, Iterator
 
 # Internal Imports
 sys.path.append("../driptorch")
@@ -12,8 +17,30 @@ from driptorch.io import *
 from driptorch._version import __version__
 from resources import simulations
 
+# External Imports
+import orjson
 
-def generate_simulations(
+
+# Firing techniques run by the pipeline as (key, technique, takes a crew, simulation
+# args that must be set, builder of the generate_pattern args and kwargs)
+_TECHNIQUES = (
+    ("inferno_pattern", dt.firing.Inferno, False, (),
+     lambda args: ((), {})),
+    ("ring_pattern", dt.firing.Ring, True, (),
+     lambda args: ((args["offset"],), {})),
+    ("head_pattern", dt.firing.Head, True, (),
+     lambda args: ((args["offset"],), {})),
+    ("back_pattern", dt.firing.Back, True, (),
+     lambda args: ((args["offset"],), {})),
+    ("flank_pattern", dt.firing.Flank, True, ("igniter_depth",),
+     lambda args: ((args["igniter_depth"], args["heat_depth"]), {})),
+    ("strip_pattern", dt.firing.Strip, True, ("igniter_depth", "igniter_spacing"),
+     lambda args: ((), {"spacing": args["igniter_spacing"], "depth": args["igniter_depth"],
+                        "heat_depth": args["heat_depth"]})),
+)
+
+
+def iter_simulations(
     unit_bounds: dict,
     front_buffer: int,
     back_buffer: int,
@@ -24,9 +51,12 @@ def generate_simulations(
     igniter_spacing: float = None,
     igniter_depth: float = None,
     heat_depth: float = None,
+    only: Iterable[str] = None,
     **kwargs
-) -> dict:
-    """Generates a suite of all available patterns from a set of arguments
+) -> Iterator[tuple[str, Any]]:
+    """Generates a suite of all available patterns from a set of arguments. Entries
+    are yielded one at a time so that each can be written out and released before
+    the next pattern is built.
 
     Args:
         unit_bounds (dict): geoJSON of the unit bondary
@@ -43,83 +73,214 @@ def generate_simulations(
         igniter_spacing (float, optional): Staggering distance in meters between igniters within a heat. Defaults to None.
         igniter_depth (float, optional): Depth in meters between igniters. If None, depth is computed by equally spacing igniters. Defaults to None.
         heat_depth (float, optional): Depth in meters between igniter heats. This argument is ignored if depth is None. Defaults to None.
+        only (Iterable[str], optional): Keys of the technique patterns to generate, e.g. {"strip_pattern"}.
+                Defaults to None, which generates every technique.
 
-    Returns:
-        dict: Simulation data dictionary of validation data
+    Yields:
+        tuple[str, Any]: Key and value of each simulation data entry
     """
 
-    simulation_date = datetime.now().isoformat()
-    simulation_version = __version__
-    simulation_data = {
-        "version": simulation_version,
-        "date": simulation_date,
-        "args": locals(),
+    # Record the scalar arguments only. The unit bounds are already stored
+    # as the burn unit GeoJSON below
+    simulation_args = {
+        "front_buffer": front_buffer,
+        "back_buffer": back_buffer,
+        "firing_direction": firing_direction,
+        "igniter_speed": igniter_speed,
+        "number_igniters": number_igniters,
+        "offset": offset,
+        "igniter_spacing": igniter_spacing,
+        "igniter_depth": igniter_depth,
+        "heat_depth": heat_depth,
     }
+    yield "version", __version__
+    yield "date", datetime.now().isoformat()
+    yield "args", simulation_args
 
     burn_unit = dt.BurnUnit.from_json(
         unit_bounds, firing_direction=firing_direction)
     polygonsplitter = dt.unit.PolygonSplitter()
     polygonsplitter.split(burn_unit.polygon)
-    simulation_data["burn_unit_fore"] = polygonsplitter.fore.__geo_interface__
-    simulation_data["burn_unit_aft"] = polygonsplitter.aft.__geo_interface__
-    simulation_data["burn_unit_port"] = polygonsplitter.port.__geo_interface__
-    simulation_data["burn_unit_starboard"] = polygonsplitter.starboard.__geo_interface__
+    yield "burn_unit_fore", polygonsplitter.fore.__geo_interface__
+    yield "burn_unit_aft", polygonsplitter.aft.__geo_interface__
+    yield "burn_unit_port", polygonsplitter.port.__geo_interface__
+    yield "burn_unit_starboard", polygonsplitter.starboard.__geo_interface__
 
-    firing_area = burn_unit.buffer_control_line(front_buffer)
-    firing_area = firing_area.buffer_downwind(back_buffer)
+    firing_area = burn_unit.buffer_firing_area(front_buffer, back_buffer)
     blackline_area = burn_unit.difference(firing_area)
-    domain = firing_area.copy()
-    simulation_data["epsg"] = domain.utm_epsg
-    simulation_data["lower_left"] = domain.bounds.min(axis=0).tolist()
-    simulation_data["burn_unit"] = burn_unit.to_json()
-    simulation_data["firing_area"] = firing_area.to_json()
-    simulation_data["blackline"] = blackline_area.to_json()
+    yield "epsg", firing_area.utm_epsg
+    # Shapely bounds are already a (minx, miny, maxx, maxy) tuple of floats
+    yield "lower_left", firing_area.polygon.bounds[:2]
+    yield "burn_unit", burn_unit.to_json()
+    yield "firing_area", firing_area.to_json()
+    yield "blackline", blackline_area.to_json()
 
     dash_igniter = dt.Igniter(igniter_speed)
     point_crew = dt.IgnitionCrew.clone_igniter(dash_igniter, number_igniters)
 
-    simulation_data["igniter"] = dash_igniter.to_json()
-    simulation_data["firing_crew"] = point_crew.to_json()
-
-    # Inferno Technique
-    inferno_technique = dt.firing.Inferno(firing_area)
-    inferno_pattern = inferno_technique.generate_pattern()
-    simulation_data["inferno_pattern"] = inferno_pattern.to_dict()
-
-    # Ring Technique
-    ring_technique = dt.firing.Ring(firing_area, point_crew)
-    ring_pattern = ring_technique.generate_pattern(offset)
-    simulation_data["ring_pattern"] = ring_pattern.to_dict()
-
-    # Make validation data for quicfire
-    ring_pattern.to_quicfire(firing_area,"quicfire_output_test_ring.dat")
-
-    # Head Technique
-    head_technique = dt.firing.Head(firing_area, point_crew)
-    head_pattern = head_technique.generate_pattern(offset)
-    simulation_data["head_pattern"] = head_pattern.to_dict()
-
-    # Back Technique
-    back_technique = dt.firing.Back(firing_area, point_crew)
-    back_pattern = back_technique.generate_pattern(offset)
-    simulation_data["back_pattern"] = back_pattern.to_dict()
-    if igniter_depth:
-
-        # Flank Technique
-        flank_technique = dt.firing.Flank(firing_area, point_crew)
-        flank_pattern = flank_technique.generate_pattern(
-            igniter_depth, heat_depth)
-        simulation_data["flank_pattern"] = flank_pattern.to_dict()
-    if igniter_depth and igniter_spacing:
-
-        # Strip Technique
-        strip_technique = dt.firing.Strip(firing_area, point_crew)
-        strip_pattern = strip_technique.generate_pattern(
-            spacing=igniter_spacing, depth=igniter_depth, heat_depth=heat_depth
-        )
-        simulation_data["strip_pattern"] = strip_pattern.to_dict()
-
-    return simulation_data
+    yield "igniter", dash_igniter.to_json()
+    yield "firing_crew", point_crew.to_json()
+
+    # The firing techniques are independent of each other, so build the list of
+    # (key, technique, constructor args, pattern args, pattern kwargs) and run them
+    # in parallel
+    techniques = []
+    for key, technique, uses_crew, requires, make_args in _TECHNIQUES:
+        if only is not None and key not in only:
+            continue
+        if all(simulation_args[name] for name in requires):
+            init_args = (firing_area, point_crew) if uses_crew else (firing_area,)
+            techniques.append((key, technique, init_args, *make_args(simulation_args)))
+
+    for key, pattern in _run_techniques(techniques):
+        # Coordinates stay packed in NumPy and are encoded by orjson on write
+        yield key, pattern.to_dict(packed=True)
+
+        # Make validation data for quicfire
+        if key == "ring_pattern":
+            pattern.to_quicfire(firing_area, "quicfire_output_test_ring.dat")
+
+
+def _generate_pattern(technique: type, init_args: tuple, pattern_args: tuple, pattern_kwargs: dict) -> dt.Pattern:
+    """Build a firing technique and generate its pattern. Defined at module level
+    so it can be sent to worker processes.
+
+    Args:
+        technique (type): Firing technique class
+        init_args (tuple): Positional arguments for the technique constructor
+        pattern_args (tuple): Positional arguments for `generate_pattern`
+        pattern_kwargs (dict): Keyword arguments for `generate_pattern`
+
+    Returns:
+        dt.Pattern: Generated ignition pattern
+    """
+
+    return technique(*init_args).generate_pattern(*pattern_args, **pattern_kwargs)
+
+
+def _run_techniques(techniques: list[tuple]) -> Iterator[tuple[str, dt.Pattern]]:
+    """Generate the patterns for a list of firing techniques across worker processes
+
+    Args:
+        techniques (list[tuple]): (key, technique, constructor args, pattern args, pattern kwargs) entries
+
+    Yields:
+        tuple[str, dt.Pattern]: Key and generated pattern, in the order given
+    """
+
+    # Not worth spinning up a pool for a single technique
+    if len(techniques) < 2:
+        for key, *job in techniques:
+            yield key, _generate_pattern(*job)
+        return
+
+    max_workers = min(len(techniques), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(key, executor.submit(_generate_pattern, *job))
+                   for key, *job in techniques]
+        for key, future in futures:
+            yield key, future.result()
+
+
+def _driptorch_source_digest() -> bytes:
+    """Hash the source of the DripTorch package, so cached patterns are regenerated
+    whenever a firing technique or anything it uses changes
+
+    Returns:
+        bytes: Digest of every module in the package
+    """
+
+    package_dir = path.dirname(dt.__file__)
+    digest = hashlib.blake2b(digest_size=16)
+    for root, dirs, files in os.walk(package_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                file_path = path.join(root, name)
+                digest.update(path.relpath(file_path, package_dir).encode())
+                with open(file_path, "rb") as file:
+                    digest.update(file.read())
+
+    return digest.digest()
+
+
+def simulation_cache_key(simulation_args: dict) -> str:
+    """Hash a set of simulation arguments, the DripTorch version and the DripTorch
+    source into a short key
+
+    Args:
+        simulation_args (dict): Arguments passed to `iter_simulations`
+
+    Returns:
+        str: Hex digest identifying the arguments and the code that uses them
+    """
+
+    payload = orjson.dumps([__version__, simulation_args], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload + _driptorch_source_digest(), digest_size=8).hexdigest()
+
+
+def cached_pattern(cache_dir: str, technique_key: str, **simulation_args) -> dict:
+    """Generate a single technique pattern, reusing a previous result when it was
+    already generated from the same arguments and DripTorch source. Results are
+    stored under `cache_dir/<cache key>/<technique key>.json`.
+
+    Args:
+        cache_dir (str): Directory holding the cached patterns
+        technique_key (str): Simulation data key of the pattern, e.g. "strip_pattern"
+        **simulation_args: Keyword arguments passed to `iter_simulations`
+
+    Returns:
+        dict: Pattern path parameters
+    """
+
+    cache_path = path.join(cache_dir, simulation_cache_key(simulation_args),
+                           technique_key + ".json")
+    if path.exists(cache_path):
+        with open(cache_path, "rb") as file:
+            return orjson.loads(file.read())
+
+    entries = dict(iter_simulations(only={technique_key}, **simulation_args))
+    os.makedirs(path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, "wb") as file:
+        file.write(orjson.dumps(entries[technique_key],
+                                option=orjson.OPT_SERIALIZE_NUMPY))
+
+    return entries[technique_key]
+
+
+def prune_pattern_cache(cache_dir: str, keep: Iterable[str]) -> None:
+    """Remove cached patterns for every cache key not listed in `keep`
+
+    Args:
+        cache_dir (str): Directory holding the cached patterns
+        keep (Iterable[str]): Cache keys to keep
+    """
+    if not path.isdir(cache_dir):
+        return
+
+    keep = set(keep)
+    for key in os.listdir(cache_dir):
+        if key not in keep:
+            shutil.rmtree(path.join(cache_dir, key), ignore_errors=True)
+
+
+def write_simulation_data(write_path: str, simulation_items: Iterable[tuple[str, Any]]) -> None:
+    """Stream simulation data entries to a JSON file without first collecting
+    them in a dictionary
+
+    Args:
+        write_path (str): relative path to write the simulation data to
+        simulation_items (Iterable[tuple[str, Any]]): key and value pairs, e.g. from `iter_simulations`
+    """
+    with open(write_path, "wb") as file:
+        file.write(b"{")
+        for i, (key, value) in enumerate(simulation_items):
+            if i:
+                file.write(b",")
+            file.write(orjson.dumps(key) + b":" +
+                       orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+        file.write(b"}")
+
 
 def patch_simulation_data(read_path: str, patch_data: dict) -> None:
     """Patch a given simulation dataset with updated values
@@ -128,20 +289,34 @@ def patch_simulation_data(read_path: str, patch_data: dict) -> None:
         read_path (str): relative path to simulation data
         patch_data (dict): dictionary of data and its respective value
     """
-    with open(read_path, "r") as file:
-        sim_data = json.load(file)
+    with open(read_path, "rb") as file:
+        sim_data = orjson.loads(file.read())
 
-    for k,v in patch_data.items():
-        sim_data[k] = v
+    # Values are stored as-is and encoded once when the file is written
+    sim_data.update(patch_data)
 
-    with open(read_path, "w") as file:
-        json.dump(sim_data, file)
+    with open(read_path, "wb") as file:
+        file.write(orjson.dumps(sim_data, option=orjson.OPT_SERIALIZE_NUMPY))
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate the DripTorch validation data")
+    parser.add_argument("--all", action="store_true",
+                        help="regenerate the whole dataset instead of patching the strip pattern")
+    cli_args = parser.parse_args()
+
     simargs = simulations.simulation_args
-    simulation_data = generate_simulations(**simargs)
     write_path = path.join(path.dirname(__file__),
                            "resources/simulation_0.json")
-    patch_data = {"strip_pattern":simulation_data["strip_pattern"]}
+
+    if cli_args.all:
+        # Stream every entry straight to disk, with the techniques run in parallel
+        write_simulation_data(write_path, iter_simulations(**simargs))
+        sys.exit()
+
+    cache_dir = path.join(path.dirname(__file__), "resources/simulation_0")
+
+    # Only the strip pattern is patched, so don't generate the other techniques
+    patch_data = {"strip_pattern": cached_pattern(cache_dir, "strip_pattern", **simargs)}
+    prune_pattern_cache(cache_dir, keep=[simulation_cache_key(simargs)])
 
     patch_simulation_data(write_path,patch_data=patch_data)
@@ -1,6 +1,14 @@
 # Core imports
 from datetime import datetime
+from functools import cache
 import json
+from pathlib import Path
+
+# orjson parses the validation data much faster, but isn't required
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Internal imports
 import driptorch as dt
@@ -19,3 +27,23 @@ simulation_args = {
     "offset": 50
 }
 
+RESOURCE_DIR = Path(__file__).resolve().parent
+
+
+@cache
+def resource_path(name: str) -> Path:
+    """Absolute path of a file in the test resources directory. Resolved once per
+    name."""
+
+    return RESOURCE_DIR / name
+
+
+SIMULATION_FILE = resource_path("simulation_0.json")
+
+
+@cache
+def load_validation_data() -> dict:
+    """Parse the validation dataset, once per process. Callers share the returned
+    dictionary and must not modify it."""
+
+    return json_loads(SIMULATION_FILE.read_bytes())